@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -11,37 +10,54 @@ from homeassistant.components.binary_sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import (
+    DATA_DEVICES,
+    DATA_PARAMETERS,
+    DOMAIN,
+    PARAM_COLD_WEATHER_SHUTDOWN,
+    PARAM_PERMANENT_COOL_DEMAND,
+    PARAM_PERMANENT_HEAT_DEMAND,
+    PARAM_WARM_WEATHER_SHUTDOWN,
+)
 from .coordinator import SensorLinxDataUpdateCoordinator
+from .entity import SensorLinxEntity, build_device_info, description_suffixes
 
 _LOGGER = logging.getLogger(__name__)
 
+_TRUTHY = frozenset(("true", "on", "1", "yes", "active"))
+
 BINARY_SENSOR_DESCRIPTIONS: tuple[BinarySensorEntityDescription, ...] = (
     BinarySensorEntityDescription(
-        key="permanent_heat_demand",
+        key=PARAM_PERMANENT_HEAT_DEMAND,
         name="Permanent Heat Demand",
         device_class=BinarySensorDeviceClass.HEAT,
     ),
     BinarySensorEntityDescription(
-        key="permanent_cool_demand", 
+        key=PARAM_PERMANENT_COOL_DEMAND, 
         name="Permanent Cool Demand",
         device_class=BinarySensorDeviceClass.COLD,
     ),
     BinarySensorEntityDescription(
-        key="warm_weather_shutdown",
+        key=PARAM_WARM_WEATHER_SHUTDOWN,
         name="Warm Weather Shutdown",
         device_class=BinarySensorDeviceClass.PROBLEM,
     ),
     BinarySensorEntityDescription(
-        key="cold_weather_shutdown",
+        key=PARAM_COLD_WEATHER_SHUTDOWN,
         name="Cold Weather Shutdown", 
         device_class=BinarySensorDeviceClass.PROBLEM,
     ),
 )
 
+_DESC_BY_KEY: dict[str, BinarySensorEntityDescription] = {
+    description.key: description for description in BINARY_SENSOR_DESCRIPTIONS
+}
+
+_SUFFIXES = description_suffixes(BINARY_SENSOR_DESCRIPTIONS)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -53,31 +69,34 @@ async def async_setup_entry(
     
     entities = []
     
+    debug = _LOGGER.isEnabledFor(logging.DEBUG)
     _LOGGER.debug("Setting up binary sensor platform")
-    _LOGGER.debug("Coordinator data: %s", coordinator.data)
     
-    if coordinator.data and "devices" in coordinator.data:
-        devices = coordinator.data["devices"]
+    if coordinator.data and DATA_DEVICES in coordinator.data:
+        devices = coordinator.data[DATA_DEVICES]
+        if not devices:
+            _LOGGER.debug("No devices to add")
+            return
+
         _LOGGER.debug("Found %d devices in coordinator data", len(devices))
         
         for device_id, device in devices.items():
-            _LOGGER.debug("Processing device %s: %s", device_id, device)
-            device_parameters = device.get("parameters", {})
-            _LOGGER.debug("Device %s parameters: %s", device_id, device_parameters)
+            device_parameters = device.get(DATA_PARAMETERS, {})
+            if debug:
+                _LOGGER.debug("Device %s parameters: %s", device_id, device_parameters)
             
-            for description in BINARY_SENSOR_DESCRIPTIONS:
-                if description.key in device_parameters:
-                    _LOGGER.debug("Creating binary sensor %s for device %s", description.key, device_id)
-                    entities.append(
-                        SensorLinxBinarySensor(
-                            coordinator,
-                            description,
-                            device_id,
-                            device,
-                        )
-                    )
-                else:
-                    _LOGGER.debug("Device %s does not have parameter %s", device_id, description.key)
+            # One device info shared by every binary sensor of this device
+            device_info = build_device_info(device_id, device)
+            entities.extend(
+                SensorLinxBinarySensor(
+                    coordinator,
+                    _DESC_BY_KEY[key],
+                    device_id,
+                    device_info,
+                )
+                for key in device_parameters
+                if key in _DESC_BY_KEY
+            )
     else:
         _LOGGER.debug("No coordinator data or devices found")
     
@@ -85,7 +104,7 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class SensorLinxBinarySensor(CoordinatorEntity, BinarySensorEntity):
+class SensorLinxBinarySensor(SensorLinxEntity, BinarySensorEntity):
     """Implementation of a SensorLinx binary sensor."""
 
     def __init__(
@@ -93,66 +112,48 @@ class SensorLinxBinarySensor(CoordinatorEntity, BinarySensorEntity):
         coordinator: SensorLinxDataUpdateCoordinator,
         description: BinarySensorEntityDescription,
         device_id: str,
-        device: dict[str, Any],
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the binary sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, device_id, device_info)
         self.entity_description = description
-        self._device_id = device_id
-        self._device = device
-        
-        self._attr_unique_id = f"{device_id}_{description.key}"
-        self._attr_name = f"{device.get('name', device_id)} {description.name}"
+        self._key = description.key
         
-        # Device info
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device_id)},
-            "name": device.get("name", device_id),
-            "manufacturer": "SensorLinx",
-            "model": device.get("deviceType", "Unknown"),
-            "sw_version": device.get("firmware_version"),
-        }
+        id_suffix, name_suffix = _SUFFIXES[description.key]
+        self._attr_unique_id = device_id + id_suffix
+        self._attr_name = device_info["name"] + name_suffix
 
     @property
     def is_on(self) -> bool | None:
         """Return true if the binary sensor is on."""
-        if not self.coordinator.data or "devices" not in self.coordinator.data:
+        # Don't report values left over from before a failed update
+        if not self.coordinator.last_update_success:
             return None
-            
-        device = self.coordinator.data["devices"].get(self._device_id)
-        if not device:
+
+        parameters = self._parameters()
+        if parameters is None:
             return None
-            
-        parameters = device.get("parameters", {})
-        value = parameters.get(self.entity_description.key)
-        
+
+        key = self._key
+        value = parameters.get(key)
         if value is None:
             return None
         
         # Handle different parameter types
-        if self.entity_description.key in ["permanent_heat_demand", "permanent_cool_demand"]:
+        if key in [PARAM_PERMANENT_HEAT_DEMAND, PARAM_PERMANENT_COOL_DEMAND]:
             # These are boolean values from the API
             return bool(value)
-        elif self.entity_description.key in ["warm_weather_shutdown", "cold_weather_shutdown"]:
+        elif key in [PARAM_WARM_WEATHER_SHUTDOWN, PARAM_COLD_WEATHER_SHUTDOWN]:
             # These are temperature values - consider "on" if not disabled (32°F means disabled)
             return value != 32 if isinstance(value, (int, float)) else False
         
         # Default handling
-        if isinstance(value, bool):
+        value_type = type(value)
+        if value_type is bool:
             return value
-        elif isinstance(value, (int, float)):
+        if value_type is int or value_type is float:
             return value > 0
-        elif isinstance(value, str):
-            return value.lower() in ("true", "on", "1", "yes", "active")
+        if value_type is str:
+            return value.lower() in _TRUTHY
         
         return None
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return (
-            self.coordinator.last_update_success
-            and self.coordinator.data is not None
-            and "devices" in self.coordinator.data
-            and self._device_id in self.coordinator.data["devices"]
-        )
@@ -2,9 +2,13 @@
 from __future__ import annotations
 
 import logging
+import time
 from typing import Any
 
+from pysensorlinx.sensorlinx import Temperature
+
 from homeassistant.components.climate import (
+    ATTR_HVAC_MODE,
     ClimateEntity,
     ClimateEntityFeature,
     HVACAction,
@@ -14,13 +18,58 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DEVICE_TYPE_HEAT_PUMP, DEVICE_TYPE_THERMOSTAT, DOMAIN
+from .const import (
+    DATA_DEVICES,
+    DEVICE_TYPE_HEAT_PUMP,
+    DEVICE_TYPE_THERMOSTAT,
+    DOMAIN,
+    OPTIMISTIC_STATE_TIMEOUT,
+    PARAM_HVAC_MODE,
+    PARAM_PERMANENT_COOL_DEMAND,
+    PARAM_PERMANENT_HEAT_DEMAND,
+    PARAM_TARGET_TEMPERATURE_COLD_TANK,
+    PARAM_TARGET_TEMPERATURE_HOT_TANK,
+    PARAM_TEMPERATURE_COLD_TANK,
+    PARAM_TEMPERATURE_HOT_TANK,
+)
 from .coordinator import SensorLinxDataUpdateCoordinator
+from .entity import SensorLinxEntity, build_device_info
 
 _LOGGER = logging.getLogger(__name__)
 
+_HVAC_MODE_MAP: dict[str, HVACMode] = {
+    "off": HVACMode.OFF,
+    "heat": HVACMode.HEAT,
+    "cool": HVACMode.COOL,
+    "auto": HVACMode.AUTO,
+}
+
+
+def _extract_mode(parameters: dict[str, Any]) -> HVACMode:
+    """Return the HVAC mode stored in a device's parameters."""
+    mode = parameters.get(PARAM_HVAC_MODE)
+    if not mode:
+        return HVACMode.AUTO  # Default to auto
+
+    return _HVAC_MODE_MAP.get(mode.lower(), HVACMode.AUTO)
+
+
+# Target temperature parameters read and written per mode; other modes use the hot tank
+_TARGET_TEMP_KEYS: dict[HVACMode, str] = {
+    HVACMode.COOL: PARAM_TARGET_TEMPERATURE_COLD_TANK,
+}
+_TARGET_TEMP_WRITE_KEYS: dict[HVACMode, str] = {
+    HVACMode.COOL: "cold_tank_min_temp",
+}
+
+# Mode priorities SensorLinx accepts; it has no "off" priority
+_HVAC_MODE_PRIORITIES: dict[HVACMode, str] = {
+    HVACMode.HEAT: "heat",
+    HVACMode.COOL: "cool",
+    HVACMode.AUTO: "auto",
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -30,24 +79,24 @@ async def async_setup_entry(
     """Set up the climate platform."""
     coordinator: SensorLinxDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
     
-    entities = []
-    
-    if coordinator.data and "devices" in coordinator.data:
-        for device_id, device in coordinator.data["devices"].items():
-            device_type = device.get("type", "").lower()
-            if device_type in [DEVICE_TYPE_THERMOSTAT, DEVICE_TYPE_HEAT_PUMP]:
-                entities.append(
-                    SensorLinxClimate(
-                        coordinator,
-                        device_id,
-                        device,
-                    )
-                )
+    devices = coordinator.data.get(DATA_DEVICES) if coordinator.data else None
+    if not devices:
+        return
     
-    async_add_entities(entities)
+    async_add_entities(
+        [
+            SensorLinxClimate(
+                coordinator,
+                device_id,
+                device,
+            )
+            for device_id, device in devices.items()
+            if device.get("type", "").lower() in (DEVICE_TYPE_THERMOSTAT, DEVICE_TYPE_HEAT_PUMP)
+        ]
+    )
 
 
-class SensorLinxClimate(CoordinatorEntity, ClimateEntity):
+class SensorLinxClimate(SensorLinxEntity, ClimateEntity):
     """Implementation of a SensorLinx climate entity."""
 
     def __init__(
@@ -57,12 +106,13 @@ class SensorLinxClimate(CoordinatorEntity, ClimateEntity):
         device: dict[str, Any],
     ) -> None:
         """Initialize the climate entity."""
-        super().__init__(coordinator)
-        self._device_id = device_id
-        self._device = device
+        super().__init__(coordinator, device_id, build_device_info(device_id, device))
+        # Written values shown until the coordinator reports them
+        self._optimistic: dict[str, Any] = {}
+        self._optimistic_expires_at = 0.0
         
         self._attr_unique_id = f"{device_id}_climate"
-        self._attr_name = f"{device.get('name', device_id)} Climate"
+        self._attr_name = f"{device.get('name') or device_id} Climate"
         self._attr_temperature_unit = UnitOfTemperature.CELSIUS
         
         # Supported features
@@ -79,94 +129,80 @@ class SensorLinxClimate(CoordinatorEntity, ClimateEntity):
             HVACMode.COOL,
             HVACMode.AUTO,
         ]
-        
-        # Device info
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device_id)},
-            "name": device.get("name", device_id),
-            "manufacturer": "SensorLinx",
-            "model": device.get("type", "Unknown"),
-            "sw_version": device.get("firmware_version"),
-        }
+
+    def _parameters(self) -> dict[str, Any] | None:
+        """Return this device's parameters, overlaid with unconfirmed writes."""
+        parameters = super()._parameters()
+        if parameters is None or not self._optimistic:
+            return parameters
+
+        if time.monotonic() >= self._optimistic_expires_at:
+            self._optimistic.clear()
+            return parameters
+
+        return {**parameters, **self._optimistic}
+
+    def _set_optimistic(self, values: dict[str, Any]) -> None:
+        """Show written values until the coordinator confirms them."""
+        self._optimistic.update(values)
+        self._optimistic_expires_at = time.monotonic() + OPTIMISTIC_STATE_TIMEOUT
+        self.async_write_ha_state()
+
+    def _update_from_coordinator(self) -> None:
+        """Cache the coordinator data and drop optimistic values it now reports."""
+        super()._update_from_coordinator()
+        if self._optimistic:
+            parameters = super()._parameters() or {}
+            self._optimistic = {
+                key: value
+                for key, value in self._optimistic.items()
+                if parameters.get(key) != value
+            }
 
     @property
     def current_temperature(self) -> float | None:
         """Return the current temperature."""
-        if not self.coordinator.data or "devices" not in self.coordinator.data:
+        parameters = self._parameters()
+        if parameters is None:
             return None
-            
-        device = self.coordinator.data["devices"].get(self._device_id)
-        if not device:
-            return None
-            
-        parameters = device.get("parameters", {})
+
         # Try to get hot tank temperature first, then cold tank
-        temp = parameters.get("temperature_hot_tank") or parameters.get("temperature_cold_tank")
-        return temp
+        return parameters.get(PARAM_TEMPERATURE_HOT_TANK) or parameters.get(PARAM_TEMPERATURE_COLD_TANK)
 
     @property
     def target_temperature(self) -> float | None:
         """Return the temperature we try to reach."""
-        if not self.coordinator.data or "devices" not in self.coordinator.data:
-            return None
-            
-        device = self.coordinator.data["devices"].get(self._device_id)
-        if not device:
+        parameters = self._parameters()
+        if parameters is None:
             return None
-            
-        parameters = device.get("parameters", {})
+
         # Get target temperature based on current mode
-        hvac_mode = self.hvac_mode
-        if hvac_mode == HVACMode.HEAT:
-            return parameters.get("target_temperature_hot_tank")
-        elif hvac_mode == HVACMode.COOL:
-            return parameters.get("target_temperature_cold_tank")
-        else:
-            # Auto mode - return hot tank target as default
-            return parameters.get("target_temperature_hot_tank")
+        return parameters.get(
+            _TARGET_TEMP_KEYS.get(_extract_mode(parameters), PARAM_TARGET_TEMPERATURE_HOT_TANK)
+        )
 
     @property
     def hvac_mode(self) -> HVACMode | None:
         """Return hvac operation ie. heat, cool mode."""
-        if not self.coordinator.data or "devices" not in self.coordinator.data:
+        parameters = self._parameters()
+        if parameters is None:
             return None
-            
-        device = self.coordinator.data["devices"].get(self._device_id)
-        if not device:
-            return None
-            
-        parameters = device.get("parameters", {})
-        mode = parameters.get("hvac_mode", "").lower()
-        
-        if mode == "off":
-            return HVACMode.OFF
-        elif mode == "heat":
-            return HVACMode.HEAT
-        elif mode == "cool":
-            return HVACMode.COOL
-        elif mode == "auto":
-            return HVACMode.AUTO
-        
-        return HVACMode.AUTO  # Default to auto
+
+        return _extract_mode(parameters)
 
     @property
     def hvac_action(self) -> HVACAction | None:
         """Return the current running hvac operation."""
-        if not self.coordinator.data or "devices" not in self.coordinator.data:
-            return None
-            
-        device = self.coordinator.data["devices"].get(self._device_id)
-        if not device:
+        parameters = self._parameters()
+        if parameters is None:
             return None
-            
-        parameters = device.get("parameters", {})
         
         # Check demand states
-        if parameters.get("permanent_heat_demand", False):
+        if parameters.get(PARAM_PERMANENT_HEAT_DEMAND, False):
             return HVACAction.HEATING
-        elif parameters.get("permanent_cool_demand", False):
+        elif parameters.get(PARAM_PERMANENT_COOL_DEMAND, False):
             return HVACAction.COOLING
-        elif self.hvac_mode != HVACMode.OFF:
+        elif _extract_mode(parameters) != HVACMode.OFF:
             return HVACAction.IDLE
         
         return HVACAction.OFF
@@ -179,43 +215,44 @@ class SensorLinxClimate(CoordinatorEntity, ClimateEntity):
             
         try:
             # Get building info from coordinator data
-            if not self.coordinator.data or "devices" not in self.coordinator.data:
+            if not self.coordinator.data or DATA_DEVICES not in self.coordinator.data:
                 _LOGGER.error("No coordinator data available")
                 return
                 
-            device = self.coordinator.data["devices"].get(self._device_id)
+            device = self.coordinator.data[DATA_DEVICES].get(self._device_id)
             if not device:
                 _LOGGER.error("Device %s not found in coordinator data", self._device_id)
                 return
             
-            # Find the building ID for this device
-            building_id = None
-            for building in self.coordinator.data.get("buildings", []):
-                # You'll need to implement logic to find which building this device belongs to
-                # For now, use the first building
-                building_id = building.get("id")
-                break
-                
+            building_id = self.coordinator.building_id(self._device_id)
             if not building_id:
                 _LOGGER.error("No building ID found for device %s", self._device_id)
                 return
             
-            # Create device helper and set temperature based on current mode
-            from pysensorlinx.sensorlinx import SensorlinxDevice, Temperature
-            device_helper = SensorlinxDevice(self.coordinator.sensorlinx, building_id, self._device_id)
-            
             # Convert temperature to Fahrenheit (SensorLinx uses Fahrenheit)
             temp_f = Temperature(temperature, "C").to_fahrenheit() if self.temperature_unit == UnitOfTemperature.CELSIUS else temperature
             temp_obj = Temperature(temp_f, "F")
             
-            hvac_mode = self.hvac_mode
-            if hvac_mode == HVACMode.HEAT:
-                await device_helper.set_hot_tank_target_temp(temp_obj)
-            elif hvac_mode == HVACMode.COOL:
-                await device_helper.set_cold_tank_target_temp(temp_obj)
+            # A mode passed with the temperature is written in the same request
+            parameters: dict[str, Any] = {}
+            optimistic: dict[str, Any] = {}
+            hvac_mode = kwargs.get(ATTR_HVAC_MODE)
+            priority = _HVAC_MODE_PRIORITIES.get(hvac_mode) if hvac_mode else None
+            if priority is not None:
+                parameters["hvac_mode_priority"] = optimistic[PARAM_HVAC_MODE] = priority
             else:
-                # Auto mode - set both hot and cool tank targets
-                await device_helper.set_hot_tank_target_temp(temp_obj)
+                if hvac_mode:
+                    _LOGGER.error("HVAC mode %s is not supported by SensorLinx", hvac_mode)
+                hvac_mode = self.hvac_mode
+            
+            # Set temperature based on the mode (the target is the tank minimum)
+            parameters[_TARGET_TEMP_WRITE_KEYS.get(hvac_mode, "hot_tank_min_temp")] = temp_obj
+            # Stored as the device reports it: whole degrees Fahrenheit
+            optimistic[_TARGET_TEMP_KEYS.get(hvac_mode, PARAM_TARGET_TEMPERATURE_HOT_TANK)] = round(temp_f)
+            await self.coordinator.async_set_device_parameters(
+                building_id, self._device_id, **parameters
+            )
+            self._set_optimistic(optimistic)
             
             await self.coordinator.async_request_refresh()
         except Exception as exc:
@@ -223,42 +260,32 @@ class SensorLinxClimate(CoordinatorEntity, ClimateEntity):
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new target hvac mode."""
+        priority = _HVAC_MODE_PRIORITIES.get(hvac_mode)
+        if priority is None:
+            _LOGGER.error("HVAC mode %s is not supported by SensorLinx", hvac_mode)
+            return
+
         try:
             # Get building info from coordinator data
-            if not self.coordinator.data or "devices" not in self.coordinator.data:
+            if not self.coordinator.data or DATA_DEVICES not in self.coordinator.data:
                 _LOGGER.error("No coordinator data available")
                 return
                 
-            device = self.coordinator.data["devices"].get(self._device_id)
+            device = self.coordinator.data[DATA_DEVICES].get(self._device_id)
             if not device:
                 _LOGGER.error("Device %s not found in coordinator data", self._device_id)
                 return
             
-            # Find the building ID for this device
-            building_id = None
-            for building in self.coordinator.data.get("buildings", []):
-                building_id = building.get("id")
-                break
-                
+            building_id = self.coordinator.building_id(self._device_id)
             if not building_id:
                 _LOGGER.error("No building ID found for device %s", self._device_id)
                 return
             
-            # Create device helper and set HVAC mode
-            from pysensorlinx.sensorlinx import SensorlinxDevice
-            device_helper = SensorlinxDevice(self.coordinator.sensorlinx, building_id, self._device_id)
-            
-            await device_helper.set_hvac_mode_priority(hvac_mode.value)
+            # Set HVAC mode
+            await self.coordinator.async_set_device_parameters(
+                building_id, self._device_id, hvac_mode_priority=priority
+            )
+            self._set_optimistic({PARAM_HVAC_MODE: priority})
             await self.coordinator.async_request_refresh()
         except Exception as exc:
             _LOGGER.error("Failed to set HVAC mode for %s: %s", self._device_id, exc)
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return (
-            self.coordinator.last_update_success
-            and self.coordinator.data is not None
-            and "devices" in self.coordinator.data
-            and self._device_id in self.coordinator.data["devices"]
-        )
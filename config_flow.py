@@ -1,21 +1,38 @@
 """Config flow for SensorLinx integration."""
 from __future__ import annotations
 
+import hashlib
 import logging
+import time
 from typing import Any
 
 import voluptuous as vol
-from pysensorlinx import Sensorlinx
+from pysensorlinx import InvalidCredentialsError, LoginError, Sensorlinx
 
 from homeassistant import config_entries
-from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.const import CONF_PASSWORD, CONF_SCAN_INTERVAL, CONF_USERNAME
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
 
-from .const import DOMAIN, ERROR_AUTH_FAILED, ERROR_CANNOT_CONNECT, ERROR_UNKNOWN
+from .const import (
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    ERROR_AUTH_FAILED,
+    ERROR_CANNOT_CONNECT,
+    ERROR_UNKNOWN,
+    MAX_SCAN_INTERVAL,
+    MIN_SCAN_INTERVAL,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Successful validations are reused for this long so that retrying the flow
+# does not log in to SensorLinx again
+VALIDATION_CACHE_TTL = 60
+
+_VALIDATION_CACHE: dict[tuple[str, str], tuple[float, dict[str, Any]]] = {}
+
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_USERNAME): str,
@@ -58,6 +75,46 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
         )
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> OptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return OptionsFlowHandler(config_entry)
+
+
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle SensorLinx options."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize options flow."""
+        self._entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_SCAN_INTERVAL,
+                        default=self._entry.options.get(
+                            CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
+                        ),
+                    ): vol.All(
+                        vol.Coerce(int),
+                        vol.Range(min=MIN_SCAN_INTERVAL, max=MAX_SCAN_INTERVAL),
+                    ),
+                }
+            ),
+        )
+
 
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
@@ -72,23 +129,39 @@ async def validate_input(hass, data: dict[str, Any]) -> dict[str, Any]:
 
     Data has the keys from STEP_USER_DATA_SCHEMA with values provided by the user.
     """
+    now = time.monotonic()
+    for key, (validated_at, _) in list(_VALIDATION_CACHE.items()):
+        if now - validated_at >= VALIDATION_CACHE_TTL:
+            del _VALIDATION_CACHE[key]
+
+    cache_key = (
+        data[CONF_USERNAME],
+        hashlib.sha256(data[CONF_PASSWORD].encode()).hexdigest(),
+    )
+    if cached := _VALIDATION_CACHE.get(cache_key):
+        return cached[1]
+
     sensorlinx = Sensorlinx()
     
     try:
-        # Test authentication
+        # A successful login already proves the credentials; pysensorlinx
+        # raises when authentication fails
         await sensorlinx.login(data[CONF_USERNAME], data[CONF_PASSWORD])
-        
-        # Get user profile to confirm connection
-        profile = await sensorlinx.get_profile()
-        
-        if not profile:
-            raise InvalidAuth
-            
-        # Return info that you want to store in the config entry.
-        return {"title": f"SensorLinx ({data[CONF_USERNAME]})"}
-        
+    except InvalidCredentialsError as exc:
+        raise InvalidAuth from exc
+    except LoginError as exc:
+        # Credential errors raised mid-request are re-wrapped in a plain LoginError
+        if isinstance(exc.__context__, InvalidCredentialsError):
+            raise InvalidAuth from exc
+        _LOGGER.error("Failed to connect to SensorLinx: %s", exc)
+        raise CannotConnect from exc
     except Exception as exc:
         _LOGGER.error("Failed to connect to SensorLinx: %s", exc)
         raise CannotConnect from exc
     finally:
         await sensorlinx.close()
+
+    # Return info that you want to store in the config entry.
+    info = {"title": f"SensorLinx ({data[CONF_USERNAME]})"}
+    _VALIDATION_CACHE[cache_key] = (now, info)
+    return info
@@ -9,12 +9,34 @@ CONF_PASSWORD = "password"
 # Default values
 DEFAULT_NAME = "SensorLinx"
 DEFAULT_SCAN_INTERVAL = 300  # 5 minutes
+MIN_SCAN_INTERVAL = 60  # 1 minute
+MAX_SCAN_INTERVAL = 3600  # 1 hour
+EMPTY_ACCOUNT_SCAN_INTERVAL = 3600  # 1 hour, while the account has no buildings
+REQUEST_REFRESH_DELAY = 0.5  # seconds to collect refresh requests after a write
+OPTIMISTIC_STATE_TIMEOUT = 60  # seconds to show written values the API hasn't confirmed
 
 # Device types
 DEVICE_TYPE_SENSOR = "sensor"
 DEVICE_TYPE_THERMOSTAT = "thermostat"
 DEVICE_TYPE_HEAT_PUMP = "heat_pump"
 
+# Coordinator data keys
+DATA_PROFILE = "profile"
+DATA_BUILDINGS = "buildings"
+DATA_DEVICES = "devices"
+DATA_PARAMETERS = "parameters"
+
+# Device parameter keys
+PARAM_HVAC_MODE = "hvac_mode"
+PARAM_PERMANENT_HEAT_DEMAND = "permanent_heat_demand"
+PARAM_PERMANENT_COOL_DEMAND = "permanent_cool_demand"
+PARAM_WARM_WEATHER_SHUTDOWN = "warm_weather_shutdown"
+PARAM_COLD_WEATHER_SHUTDOWN = "cold_weather_shutdown"
+PARAM_TEMPERATURE_HOT_TANK = "temperature_hot_tank"
+PARAM_TEMPERATURE_COLD_TANK = "temperature_cold_tank"
+PARAM_TARGET_TEMPERATURE_HOT_TANK = "target_temperature_hot_tank"
+PARAM_TARGET_TEMPERATURE_COLD_TANK = "target_temperature_cold_tank"
+
 # Sensor types
 SENSOR_TEMPERATURE = "temperature"
 SENSOR_HUMIDITY = "humidity"
@@ -1,22 +1,63 @@
 """DataUpdateCoordinator for SensorLinx."""
 from __future__ import annotations
 
+import asyncio
+import collections
+import functools
 import logging
 from datetime import timedelta
 from typing import Any
 
-from pysensorlinx import Sensorlinx
+from pysensorlinx import Sensorlinx, SensorlinxDevice
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONF_PASSWORD, CONF_SCAN_INTERVAL, CONF_USERNAME
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DEFAULT_SCAN_INTERVAL, DOMAIN
+from .const import (
+    DATA_BUILDINGS,
+    DATA_DEVICES,
+    DATA_PARAMETERS,
+    DATA_PROFILE,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    EMPTY_ACCOUNT_SCAN_INTERVAL,
+    PARAM_COLD_WEATHER_SHUTDOWN,
+    PARAM_HVAC_MODE,
+    PARAM_PERMANENT_COOL_DEMAND,
+    PARAM_PERMANENT_HEAT_DEMAND,
+    PARAM_WARM_WEATHER_SHUTDOWN,
+    REQUEST_REFRESH_DELAY,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+_HVAC_MODE_NAMES = {0: "heat", 1: "cool", 2: "auto"}
+
+# Parameters copied verbatim from the matching SensorlinxDevice getter
+_PARAMETER_GETTERS: tuple[tuple[str, str], ...] = (
+    (PARAM_PERMANENT_HEAT_DEMAND, "get_permanent_heat_demand"),
+    (PARAM_PERMANENT_COOL_DEMAND, "get_permanent_cool_demand"),
+    ("hot_tank_min_temp", "get_hot_tank_min_temp"),
+    ("hot_tank_max_temp", "get_hot_tank_max_temp"),
+    ("cold_tank_min_temp", "get_cold_tank_min_temp"),
+    ("cold_tank_max_temp", "get_cold_tank_max_temp"),
+    ("firmware_version", "get_firmware_version"),
+    ("device_type", "get_device_type"),
+    (PARAM_WARM_WEATHER_SHUTDOWN, "get_warm_weather_shutdown"),
+    (PARAM_COLD_WEATHER_SHUTDOWN, "get_cold_weather_shutdown"),
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _temperature_keys(temp_name: str) -> tuple[str, str]:
+    """Return the actual and target parameter keys for a temperature sensor title."""
+    name = temp_name.lower().replace(" ", "_")
+    return "temperature_" + name, "target_temperature_" + name
+
 
 class SensorLinxDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching data from the SensorLinx API."""
@@ -25,160 +66,275 @@ class SensorLinxDataUpdateCoordinator(DataUpdateCoordinator):
         """Initialize."""
         self.sensorlinx = Sensorlinx()
         self.entry = entry
+        self.device_ids: frozenset[str] = frozenset()
+        self.update_ok = False
+        self._authenticated = False
+        self._empty_account = False
+        self._device_helpers: dict[str, SensorlinxDevice] = {}
+        self._inflight_writes: dict[str, tuple[dict[str, Any], asyncio.Task[None]]] = {}
+        self._write_successors: dict[asyncio.Task[None], asyncio.Task[None]] = {}
+        self._write_waiters: collections.Counter[asyncio.Task[None]] = collections.Counter()
         
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+            update_interval=self._configured_interval(),
+            # Writes issued back to back share a single follow-up refresh
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=REQUEST_REFRESH_DELAY, immediate=False
+            ),
         )
 
+    def _configured_interval(self) -> timedelta:
+        """Return the polling interval from the config entry options."""
+        return timedelta(
+            seconds=self.entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+        )
+
+    @callback
+    def async_apply_options(self) -> None:
+        """Apply updated config entry options to the running coordinator."""
+        # An empty account keeps its back-off until buildings appear
+        if not self._empty_account:
+            self.update_interval = self._configured_interval()
+
     async def _async_update_data(self) -> dict[str, Any]:
-      """Update data via library."""
-      _LOGGER.debug("Starting SensorLinx data update")
-      try:
-        # Login
+        """Update data via library."""
+        _LOGGER.debug("Starting SensorLinx data update")
+        try:
+            # Login only when we don't already hold a session
+            if not self._authenticated:
+                await self._async_login()
+
+            # Get user profile
+            _LOGGER.debug("Fetching user profile")
+            profile = await self.sensorlinx.get_profile()
+            if not profile:
+                # The token may have expired since the last poll; log in again once
+                _LOGGER.debug("No profile returned from SensorLinx, re-authenticating")
+                await self._async_login()
+                profile = await self.sensorlinx.get_profile()
+            if not profile:
+                _LOGGER.debug("No profile returned from SensorLinx")
+                raise ConfigEntryAuthFailed("Failed to get user profile")
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("User profile fetched: %s", profile)
+
+            # Get buildings
+            _LOGGER.debug("Fetching buildings")
+            buildings = await self.sensorlinx.get_buildings()
+            if buildings == []:
+                # The account has nothing to poll; back off until buildings appear
+                _LOGGER.debug("Account has no buildings, polling every %d seconds", EMPTY_ACCOUNT_SCAN_INTERVAL)
+                self.update_interval = timedelta(seconds=EMPTY_ACCOUNT_SCAN_INTERVAL)
+                self._empty_account = True
+                self._device_helpers.clear()
+                return {
+                    DATA_PROFILE: profile,
+                    DATA_BUILDINGS: [],
+                    DATA_DEVICES: {},
+                }
+            # Only a confirmed empty account backs off; a failed fetch keeps polling
+            self._empty_account = False
+            self.update_interval = self._configured_interval()
+            if not buildings:
+                _LOGGER.debug("No buildings returned from SensorLinx")
+                buildings = []
+            else:
+                _LOGGER.debug("Fetched %d buildings", len(buildings))
+
+            # Get devices for all buildings concurrently
+            devices = {}
+            for building_devices in await asyncio.gather(
+                *(self._async_fetch_building(building) for building in buildings)
+            ):
+                devices.update(building_devices)
+
+            # Drop helpers for devices that are no longer reported
+            for device_id in self._device_helpers.keys() - devices.keys():
+                del self._device_helpers[device_id]
+
+            _LOGGER.debug("Data update complete: profile=%s, buildings=%d, devices=%d",
+                    bool(profile), len(buildings), len(devices))
+            return {
+                DATA_PROFILE: profile,
+                DATA_BUILDINGS: buildings,
+                DATA_DEVICES: devices,
+            }
+
+        except ConfigEntryAuthFailed:
+            _LOGGER.debug("Authentication failed during data update")
+            self._authenticated = False
+            raise
+        except Exception as exc:
+            _LOGGER.error("Error communicating with SensorLinx API: %s", exc)
+            raise UpdateFailed(f"Error communicating with API: {exc}") from exc
+
+    async def _async_fetch_building(self, building: dict[str, Any]) -> dict[str, dict[str, Any]]:
+        """Fetch a building's devices and extract their parameters."""
+        building_id = building.get("id")
+        _LOGGER.debug("Fetching devices for building: %s", building_id)
+        try:
+            building_devices = await self.sensorlinx.get_devices(building_id)
+        except RuntimeError as building_exc:
+            # pysensorlinx wraps every get_devices failure in RuntimeError
+            _LOGGER.warning("Failed to get devices for building %s: %s", building_id, building_exc)
+            return {}
+
+        if not building_devices:
+            _LOGGER.debug("No devices found for building %s", building_id)
+            return {}
+
+        _LOGGER.debug("Fetched %d devices for building %s", len(building_devices), building_id)
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        devices = {}
+        device_ids = [device.get("syncCode") or device.get("id") for device in building_devices]
+        all_parameters = await asyncio.gather(
+            *(
+                self._async_extract_parameters(building_id, device_id, device)
+                for device_id, device in zip(device_ids, building_devices)
+            )
+        )
+        for device_id, device, parameters in zip(device_ids, building_devices, all_parameters):
+            device[DATA_PARAMETERS] = parameters
+            if debug:
+                _LOGGER.debug("Device %s parameters: %s", device_id, parameters)
+            devices[device_id] = device
+        return devices
+
+    async def _async_extract_parameters(
+        self, building_id: str, device_id: str, device: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Extract parameters for a single device using the library methods."""
+        # Reuse the SensorlinxDevice helper from previous updates if the device hasn't moved
+        device_helper = self._device_helpers.get(device_id)
+        if device_helper is None or device_helper.building_id != building_id:
+            device_helper = SensorlinxDevice(self.sensorlinx, building_id, device_id)
+            self._device_helpers[device_id] = device_helper
+
+        temps, hvac_mode, *values = await asyncio.gather(
+            device_helper.get_temperatures(device_info=device),
+            device_helper.get_hvac_mode_priority(device_info=device),
+            *(
+                getattr(device_helper, getter)(device_info=device)
+                for _, getter in _PARAMETER_GETTERS
+            ),
+            return_exceptions=True,
+        )
+
+        # Missing parameters surface as exceptions to skip, but cancellation
+        # and other BaseExceptions must still propagate
+        for result in (temps, hvac_mode, *values):
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result
+
+        parameters = {}
+
+        # Temperature data
+        if isinstance(temps, Exception):
+            _LOGGER.warning("Failed to extract temperatures for device %s: %s", device_id, temps)
+        elif temps:
+            for temp_name, temp_data in temps.items():
+                actual_key, target_key = _temperature_keys(temp_name)
+                if temp_data.get("actual"):
+                    parameters[actual_key] = temp_data["actual"].value
+                if temp_data.get("target"):
+                    parameters[target_key] = temp_data["target"].value
+
+        # HVAC mode - convert numeric to string
+        if not isinstance(hvac_mode, Exception):
+            parameters[PARAM_HVAC_MODE] = _HVAC_MODE_NAMES.get(hvac_mode, "auto")
+
+        # Demand states, tank temperatures, device info and weather shutdown states
+        for (key, _), value in zip(_PARAMETER_GETTERS, values):
+            if not isinstance(value, Exception):
+                parameters[key] = value
+
+        return parameters
+
+    def building_id(self, device_id: str) -> str | None:
+        """Return the ID of the building a device was last reported in."""
+        device_helper = self._device_helpers.get(device_id)
+        return device_helper.building_id if device_helper else None
+
+    async def async_set_device_parameters(
+        self, building_id: str, device_id: str, **parameters: Any
+    ) -> None:
+        """Write device parameters to SensorLinx in a single request.
+
+        A request still in flight is cancelled once a newer one overwrites all
+        of its parameters; its caller then gets the newer request's result.
+        """
+        _LOGGER.debug("Writing parameters %s to device %s", parameters, device_id)
+        task = self.hass.async_create_task(
+            self.sensorlinx.set_device_parameter(building_id, device_id, **parameters)
+        )
+        previous = self._inflight_writes.get(device_id)
+        if (
+            previous is not None
+            and previous[0].keys() <= parameters.keys()
+            and previous[1].cancel()
+            and self._write_waiters[previous[1]]
+        ):
+            self._write_successors[previous[1]] = task
+
+        write = self._inflight_writes[device_id] = (parameters, task)
+        try:
+            while True:
+                # Joining happens in the same step as reading the successor,
+                # so the entry can't be dropped in between
+                self._write_waiters[task] += 1
+                try:
+                    await asyncio.shield(task)
+                    return
+                except asyncio.CancelledError:
+                    # Follow a superseded write to the one that carries its values
+                    successor = self._write_successors.get(task) if task.cancelled() else None
+                    if successor is None:
+                        raise
+                finally:
+                    self._release_write_waiter(task)
+                task = successor
+        finally:
+            if self._inflight_writes.get(device_id) is write:
+                del self._inflight_writes[device_id]
+
+    def _release_write_waiter(self, task: asyncio.Task[None]) -> None:
+        """Forget a write's successor once nobody is waiting on the write."""
+        self._write_waiters[task] -= 1
+        if self._write_waiters[task] <= 0:
+            del self._write_waiters[task]
+            self._write_successors.pop(task, None)
+
+    async def _async_login(self) -> None:
+        """Log in to SensorLinx, replacing any previous session."""
+        self._authenticated = False
         _LOGGER.debug("Logging in as user: %s", self.entry.data[CONF_USERNAME])
+        # Each login opens a new client session, so release the old one first
+        await self.sensorlinx.close()
         await self.sensorlinx.login(
-          self.entry.data[CONF_USERNAME],
-          self.entry.data[CONF_PASSWORD]
+            self.entry.data[CONF_USERNAME],
+            self.entry.data[CONF_PASSWORD],
         )
-        
-        # Get user profile
-        _LOGGER.debug("Fetching user profile")
-        profile = await self.sensorlinx.get_profile()
-        if not profile:
-          _LOGGER.debug("No profile returned from SensorLinx")
-          raise ConfigEntryAuthFailed("Failed to get user profile")
-        _LOGGER.debug("User profile fetched: %s", profile)
-        
-        # Get buildings
-        _LOGGER.debug("Fetching buildings")
-        buildings = await self.sensorlinx.get_buildings()
-        if not buildings:
-          _LOGGER.debug("No buildings returned from SensorLinx")
-          buildings = []
-        else:
-          _LOGGER.debug("Fetched %d buildings", len(buildings))
-        
-        # Get devices for each building
-        devices = {}
-        for building in buildings:
-          building_id = building.get("id")
-          _LOGGER.debug("Fetching devices for building: %s", building_id)
-          try:
-            building_devices = await self.sensorlinx.get_devices(building_id)
-            if building_devices:
-              _LOGGER.debug("Fetched %d devices for building %s", len(building_devices), building_id)
-              for device in building_devices:
-                device_id = device.get("syncCode") or device.get("id")
-                _LOGGER.debug("Processing device: %s (ID: %s)", device.get("name"), device_id)
-                
-                # Create a SensorlinxDevice helper to extract parameters
-                from pysensorlinx.sensorlinx import SensorlinxDevice
-                device_helper = SensorlinxDevice(self.sensorlinx, building_id, device_id)
-                
-                # Extract parameters using the library methods
-                parameters = {}
-                try:
-                  # Temperature data
-                  temps = await device_helper.get_temperatures(device_info=device)
-                  if temps:
-                    for temp_name, temp_data in temps.items():
-                      if temp_data.get("actual"):
-                        parameters[f"temperature_{temp_name.lower().replace(' ', '_')}"] = temp_data["actual"].value
-                      if temp_data.get("target"):
-                        parameters[f"target_temperature_{temp_name.lower().replace(' ', '_')}"] = temp_data["target"].value
-                  
-                  # HVAC and demand states
-                  try:
-                    parameters["permanent_heat_demand"] = await device_helper.get_permanent_heat_demand(device_info=device)
-                  except:
-                    pass
-                  
-                  try:
-                    parameters["permanent_cool_demand"] = await device_helper.get_permanent_cool_demand(device_info=device)
-                  except:
-                    pass
-                    
-                  try:
-                    hvac_mode = await device_helper.get_hvac_mode_priority(device_info=device)
-                    # Convert numeric to string
-                    mode_map = {0: "heat", 1: "cool", 2: "auto"}
-                    parameters["hvac_mode"] = mode_map.get(hvac_mode, "auto")
-                  except:
-                    pass
-                  
-                  # Tank temperatures
-                  try:
-                    parameters["hot_tank_min_temp"] = await device_helper.get_hot_tank_min_temp(device_info=device)
-                  except:
-                    pass
-                    
-                  try:
-                    parameters["hot_tank_max_temp"] = await device_helper.get_hot_tank_max_temp(device_info=device)
-                  except:
-                    pass
-                    
-                  try:
-                    parameters["cold_tank_min_temp"] = await device_helper.get_cold_tank_min_temp(device_info=device)
-                  except:
-                    pass
-                    
-                  try:
-                    parameters["cold_tank_max_temp"] = await device_helper.get_cold_tank_max_temp(device_info=device)
-                  except:
-                    pass
-                  
-                  # Device info
-                  try:
-                    parameters["firmware_version"] = await device_helper.get_firmware_version(device_info=device)
-                  except:
-                    pass
-                    
-                  try:
-                    parameters["device_type"] = await device_helper.get_device_type(device_info=device)
-                  except:
-                    pass
-                  
-                  # Weather shutdown states
-                  try:
-                    parameters["warm_weather_shutdown"] = await device_helper.get_warm_weather_shutdown(device_info=device)
-                  except:
-                    pass
-                    
-                  try:
-                    parameters["cold_weather_shutdown"] = await device_helper.get_cold_weather_shutdown(device_info=device)
-                  except:
-                    pass
-                  
-                except Exception as param_exc:
-                  _LOGGER.warning("Failed to extract parameters for device %s: %s", device_id, param_exc)
-                
-                device["parameters"] = parameters
-                _LOGGER.debug("Device %s parameters: %s", device_id, parameters)
-                devices[device_id] = device
-            else:
-              _LOGGER.debug("No devices found for building %s", building_id)
-          except Exception as building_exc:
-            _LOGGER.warning("Failed to get devices for building %s: %s", building_id, building_exc)
-        
-        _LOGGER.debug("Data update complete: profile=%s, buildings=%d, devices=%d",
-                bool(profile), len(buildings), len(devices))
-        return {
-          "profile": profile,
-          "buildings": buildings,
-          "devices": devices,
-        }
-        
-      except ConfigEntryAuthFailed:
-        _LOGGER.debug("Authentication failed during data update")
-        raise
-      except Exception as exc:
-        _LOGGER.error("Error communicating with SensorLinx API: %s", exc)
-        raise UpdateFailed(f"Error communicating with API: {exc}") from exc
+        self._authenticated = True
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Snapshot device availability, then notify listeners."""
+        data = self.data
+        self.device_ids = frozenset(data.get(DATA_DEVICES, {})) if data else frozenset()
+        self.update_ok = self.last_update_success and data is not None
+        super().async_update_listeners()
 
     async def async_shutdown(self) -> None:
-        """Close the SensorLinx connection."""
+        """Cancel pending refreshes and writes, then close the SensorLinx connection."""
+        # Stops the refresh debouncer so nothing logs in again after unload
+        await super().async_shutdown()
+        for _, task in self._inflight_writes.values():
+            task.cancel()
+        self._inflight_writes.clear()
+        self._write_successors.clear()
+        self._write_waiters.clear()
         if self.sensorlinx:
             await self.sensorlinx.close()
@@ -0,0 +1,90 @@
+"""Base entity for the SensorLinx integration."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.entity import EntityDescription
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DATA_DEVICES, DATA_PARAMETERS, DOMAIN
+from .coordinator import SensorLinxDataUpdateCoordinator
+
+
+def build_device_info(device_id: str, device: dict[str, Any]) -> DeviceInfo:
+    """Return the device registry info for a SensorLinx device."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, device_id)},
+        name=device.get("name") or device_id,
+        manufacturer="SensorLinx",
+        model=device.get("deviceType", "Unknown"),
+        sw_version=device.get("firmware_version"),
+    )
+
+
+def description_suffixes(
+    descriptions: Iterable[EntityDescription],
+) -> dict[str, tuple[str, str]]:
+    """Return the unique ID and name suffixes of each description, by key."""
+    return {
+        description.key: ("_" + description.key, " " + description.name)
+        for description in descriptions
+    }
+
+
+class SensorLinxEntity(CoordinatorEntity):
+    """Base class for entities bound to a single SensorLinx device."""
+
+    def __init__(
+        self,
+        coordinator: SensorLinxDataUpdateCoordinator,
+        device_id: str,
+        device_info: DeviceInfo,
+    ) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self._device_id = device_id
+        # Shared between all entities of the same device
+        self._attr_device_info = device_info
+        self._attr_available = self._device_available()
+        self._device_parameters = self._lookup_parameters()
+
+    def _device_available(self) -> bool:
+        """Return if the last update succeeded and still reported this device."""
+        return self.coordinator.update_ok and self._device_id in self.coordinator.device_ids
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_from_coordinator()
+        self.async_write_ha_state()
+
+    def _update_from_coordinator(self) -> None:
+        """Cache state derived from the coordinator data."""
+        self._attr_available = self._device_available()
+        self._device_parameters = self._lookup_parameters()
+
+    def _parameters(self) -> dict[str, Any] | None:
+        """Return this device's parameters as of the last coordinator update."""
+        return self._device_parameters
+
+    def _lookup_parameters(self) -> dict[str, Any] | None:
+        """Find this device's parameters in the coordinator data."""
+        data = self.coordinator.data
+        if not data:
+            return None
+
+        devices = data.get(DATA_DEVICES)
+        if not devices:
+            return None
+
+        device = devices.get(self._device_id)
+        return device.get(DATA_PARAMETERS, {}) if device else None
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        # Serve the value cached on the last update instead of recomputing it
+        return self._attr_available
@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -19,11 +18,12 @@ from homeassistant.const import (
     UnitOfTemperature,
 )
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import DATA_DEVICES, DATA_PARAMETERS, DOMAIN
 from .coordinator import SensorLinxDataUpdateCoordinator
+from .entity import SensorLinxEntity, build_device_info, description_suffixes
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -104,6 +104,12 @@ SENSOR_DESCRIPTIONS: tuple[SensorEntityDescription, ...] = (
     ),
 )
 
+SENSOR_DESCRIPTIONS_BY_KEY: dict[str, SensorEntityDescription] = {
+    description.key: description for description in SENSOR_DESCRIPTIONS
+}
+
+_SUFFIXES = description_suffixes(SENSOR_DESCRIPTIONS)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -115,31 +121,33 @@ async def async_setup_entry(
     
     entities = []
     
+    debug = _LOGGER.isEnabledFor(logging.DEBUG)
     _LOGGER.debug("Setting up sensor platform")
-    _LOGGER.debug("Coordinator data: %s", coordinator.data)
     
-    if coordinator.data and "devices" in coordinator.data:
-        devices = coordinator.data["devices"]
+    if coordinator.data and DATA_DEVICES in coordinator.data:
+        devices = coordinator.data[DATA_DEVICES]
+        if not devices:
+            _LOGGER.debug("No devices to add")
+            return
+
         _LOGGER.debug("Found %d devices in coordinator data", len(devices))
         
         for device_id, device in devices.items():
-            _LOGGER.debug("Processing device %s: %s", device_id, device)
-            device_parameters = device.get("parameters", {})
-            _LOGGER.debug("Device %s parameters: %s", device_id, device_parameters)
+            device_parameters = device.get(DATA_PARAMETERS, {})
+            if debug:
+                _LOGGER.debug("Device %s parameters: %s", device_id, device_parameters)
             
-            for description in SENSOR_DESCRIPTIONS:
-                if description.key in device_parameters:
-                    _LOGGER.debug("Creating sensor %s for device %s", description.key, device_id)
-                    entities.append(
-                        SensorLinxSensor(
-                            coordinator,
-                            description,
-                            device_id,
-                            device,
-                        )
-                    )
-                else:
-                    _LOGGER.debug("Device %s does not have parameter %s", device_id, description.key)
+            # One device info shared by every sensor of this device
+            device_info = build_device_info(device_id, device)
+            entities.extend(
+                SensorLinxSensor(
+                    coordinator,
+                    SENSOR_DESCRIPTIONS_BY_KEY[key],
+                    device_id,
+                    device_info,
+                )
+                for key in device_parameters.keys() & SENSOR_DESCRIPTIONS_BY_KEY.keys()
+            )
     else:
         _LOGGER.debug("No coordinator data or devices found")
     
@@ -147,7 +155,7 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class SensorLinxSensor(CoordinatorEntity, SensorEntity):
+class SensorLinxSensor(SensorLinxEntity, SensorEntity):
     """Implementation of a SensorLinx sensor."""
 
     def __init__(
@@ -155,45 +163,22 @@ class SensorLinxSensor(CoordinatorEntity, SensorEntity):
         coordinator: SensorLinxDataUpdateCoordinator,
         description: SensorEntityDescription,
         device_id: str,
-        device: dict[str, Any],
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, device_id, device_info)
         self.entity_description = description
-        self._device_id = device_id
-        self._device = device
         
-        self._attr_unique_id = f"{device_id}_{description.key}"
-        self._attr_name = f"{device.get('name', device_id)} {description.name}"
-        
-        # Device info
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device_id)},
-            "name": device.get("name", device_id),
-            "manufacturer": "SensorLinx",
-            "model": device.get("type", "Unknown"),
-            "sw_version": device.get("firmware_version"),
-        }
+        id_suffix, name_suffix = _SUFFIXES[description.key]
+        self._attr_unique_id = device_id + id_suffix
+        self._attr_name = device_info["name"] + name_suffix
 
-    @property
-    def native_value(self) -> str | int | float | None:
-        """Return the native value of the sensor."""
-        if not self.coordinator.data or "devices" not in self.coordinator.data:
-            return None
-            
-        device = self.coordinator.data["devices"].get(self._device_id)
-        if not device:
-            return None
-            
-        parameters = device.get("parameters", {})
-        return parameters.get(self.entity_description.key)
+        self._update_from_coordinator()
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return (
-            self.coordinator.last_update_success
-            and self.coordinator.data is not None
-            and "devices" in self.coordinator.data
-            and self._device_id in self.coordinator.data["devices"]
+    def _update_from_coordinator(self) -> None:
+        """Cache the native value and availability from the coordinator data."""
+        super()._update_from_coordinator()
+        parameters = self._parameters() if self._attr_available else None
+        self._attr_native_value = (
+            parameters.get(self.entity_description.key) if parameters is not None else None
         )
@@ -0,0 +1,81 @@
+"""Test the SensorLinx climate entity."""
+from unittest.mock import AsyncMock, MagicMock
+
+from homeassistant.components.climate import ATTR_HVAC_MODE, HVACMode
+from homeassistant.const import ATTR_TEMPERATURE
+
+from custom_components.sensorlinx.climate import SensorLinxClimate
+from custom_components.sensorlinx.const import (
+    DATA_DEVICES,
+    DATA_PARAMETERS,
+    PARAM_HVAC_MODE,
+    PARAM_TARGET_TEMPERATURE_HOT_TANK,
+)
+
+
+def _climate(hass):
+    """Return a climate entity for a heat pump currently in heat mode."""
+    device = {"name": "Heat Pump", DATA_PARAMETERS: {PARAM_HVAC_MODE: "heat"}}
+    coordinator = MagicMock()
+    coordinator.data = {DATA_DEVICES: {"device1": device}}
+    coordinator.building_id.return_value = "building1"
+    coordinator.async_set_device_parameters = AsyncMock()
+    coordinator.async_request_refresh = AsyncMock()
+
+    entity = SensorLinxClimate(coordinator, "device1", device)
+    entity.hass = hass
+    entity.async_write_ha_state = MagicMock()
+    return entity, coordinator
+
+
+async def test_set_temperature_with_mode_is_one_request(hass):
+    """Test a mode passed with the temperature is written in the same request."""
+    entity, coordinator = _climate(hass)
+
+    await entity.async_set_temperature(
+        **{ATTR_TEMPERATURE: 10, ATTR_HVAC_MODE: HVACMode.COOL}
+    )
+
+    coordinator.async_set_device_parameters.assert_awaited_once()
+    args, parameters = coordinator.async_set_device_parameters.await_args
+    assert args == ("building1", "device1")
+    assert parameters.keys() == {"hvac_mode_priority", "cold_tank_min_temp"}
+    assert parameters["hvac_mode_priority"] == "cool"
+    assert entity.hvac_mode == HVACMode.COOL
+
+
+async def test_set_temperature_skips_unsupported_mode(hass):
+    """Test an unsupported mode doesn't block the temperature write."""
+    entity, coordinator = _climate(hass)
+
+    await entity.async_set_temperature(
+        **{ATTR_TEMPERATURE: 50, ATTR_HVAC_MODE: HVACMode.OFF}
+    )
+
+    _, parameters = coordinator.async_set_device_parameters.await_args
+    assert parameters.keys() == {"hot_tank_min_temp"}
+
+
+async def test_set_hvac_mode_off_is_not_written(hass):
+    """Test the off mode, which SensorLinx has no priority for, isn't sent."""
+    entity, coordinator = _climate(hass)
+
+    await entity.async_set_hvac_mode(HVACMode.OFF)
+
+    coordinator.async_set_device_parameters.assert_not_awaited()
+    assert entity.hvac_mode == HVACMode.HEAT
+
+
+async def test_refresh_confirms_optimistic_target(hass):
+    """Test a refresh reporting the written target replaces the optimistic value."""
+    entity, coordinator = _climate(hass)
+
+    await entity.async_set_temperature(**{ATTR_TEMPERATURE: 50})
+    assert entity.target_temperature == 122
+
+    parameters = coordinator.data[DATA_DEVICES]["device1"][DATA_PARAMETERS]
+    parameters[PARAM_TARGET_TEMPERATURE_HOT_TANK] = 122
+    entity._update_from_coordinator()
+
+    assert not entity._optimistic
+    assert entity.target_temperature == 122
@@ -3,34 +3,42 @@ import pytest
 from unittest.mock import AsyncMock, patch
 
 from homeassistant import config_entries, data_entry_flow
-from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.const import CONF_PASSWORD, CONF_SCAN_INTERVAL, CONF_USERNAME
+from pytest_homeassistant_custom_component.common import MockConfigEntry
 
+from pysensorlinx import InvalidCredentialsError, LoginError
+
+from custom_components.sensorlinx import config_flow
 from custom_components.sensorlinx.const import DOMAIN
 
 
-async def test_form(hass):
-    """Test we get the form."""
-    result = await hass.config_entries.flow.async_init(
+@pytest.fixture
+async def user_flow(hass):
+    """Start a user config flow and return its first step."""
+    return await hass.config_entries.flow.async_init(
         DOMAIN, context={"source": config_entries.SOURCE_USER}
     )
+
+
+@patch("custom_components.sensorlinx.async_setup_entry", return_value=True)
+@patch(
+    "custom_components.sensorlinx.config_flow.validate_input",
+    return_value={"title": "SensorLinx (test@example.com)"},
+)
+async def test_form(mock_validate_input, mock_setup_entry, hass, user_flow):
+    """Test we get the form."""
+    result = user_flow
     assert result["type"] == "form"
     assert result["errors"] == {}
 
-    with patch(
-        "custom_components.sensorlinx.config_flow.validate_input",
-        return_value={"title": "SensorLinx (test@example.com)"},
-    ), patch(
-        "custom_components.sensorlinx.async_setup_entry",
-        return_value=True,
-    ) as mock_setup_entry:
-        result2 = await hass.config_entries.flow.async_configure(
-            result["flow_id"],
-            {
-                CONF_USERNAME: "test@example.com",
-                CONF_PASSWORD: "test_password",
-            },
-        )
-        await hass.async_block_till_done()
+    result2 = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        {
+            CONF_USERNAME: "test@example.com",
+            CONF_PASSWORD: "test_password",
+        },
+    )
+    await hass.async_block_till_done()
 
     assert result2["type"] == "create_entry"
     assert result2["title"] == "SensorLinx (test@example.com)"
@@ -41,23 +49,114 @@ async def test_form(hass):
     assert len(mock_setup_entry.mock_calls) == 1
 
 
-async def test_form_cannot_connect(hass):
+@patch(
+    "custom_components.sensorlinx.config_flow.validate_input",
+    side_effect=config_flow.CannotConnect,
+)
+async def test_form_cannot_connect(mock_validate_input, hass, user_flow):
     """Test we handle cannot connect error."""
-    result = await hass.config_entries.flow.async_init(
-        DOMAIN, context={"source": config_entries.SOURCE_USER}
-    )
+    result = user_flow
 
-    with patch(
-        "custom_components.sensorlinx.config_flow.validate_input",
-        side_effect=Exception,
-    ):
-        result2 = await hass.config_entries.flow.async_configure(
-            result["flow_id"],
-            {
-                CONF_USERNAME: "test@example.com",
-                CONF_PASSWORD: "test_password",
-            },
-        )
+    result2 = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        {
+            CONF_USERNAME: "test@example.com",
+            CONF_PASSWORD: "test_password",
+        },
+    )
 
     assert result2["type"] == "form"
     assert result2["errors"] == {"base": "cannot_connect"}
+
+
+async def test_validate_input_reuses_recent_success(hass):
+    """Test a recent successful validation is reused without logging in again."""
+    config_flow._VALIDATION_CACHE.clear()
+    data = {CONF_USERNAME: "test@example.com", CONF_PASSWORD: "test_password"}
+
+    with patch(
+        "custom_components.sensorlinx.config_flow.Sensorlinx"
+    ) as mock_sensorlinx:
+        client = mock_sensorlinx.return_value
+        client.login = AsyncMock()
+        client.close = AsyncMock()
+
+        first = await config_flow.validate_input(hass, data)
+        second = await config_flow.validate_input(hass, data)
+
+    assert first == second == {"title": "SensorLinx (test@example.com)"}
+    assert client.login.await_count == 1
+
+
+async def test_validate_input_invalid_auth(hass):
+    """Test rejected credentials raise InvalidAuth without fetching the profile."""
+    config_flow._VALIDATION_CACHE.clear()
+    data = {CONF_USERNAME: "test@example.com", CONF_PASSWORD: "wrong_password"}
+
+    with patch(
+        "custom_components.sensorlinx.config_flow.Sensorlinx"
+    ) as mock_sensorlinx:
+        client = mock_sensorlinx.return_value
+        client.login = AsyncMock(side_effect=InvalidCredentialsError)
+        client.get_profile = AsyncMock()
+        client.close = AsyncMock()
+
+        with pytest.raises(config_flow.InvalidAuth):
+            await config_flow.validate_input(hass, data)
+
+    client.get_profile.assert_not_awaited()
+    assert not config_flow._VALIDATION_CACHE
+
+
+async def _login_rejected(username, password):
+    """Fail the way pysensorlinx does when the server rejects the credentials."""
+    try:
+        raise InvalidCredentialsError("Invalid username or password.")
+    except Exception as exc:
+        raise LoginError(f"Exception during login: {exc}")
+
+
+@pytest.mark.parametrize(
+    ("login_error", "expected"),
+    [
+        (_login_rejected, config_flow.InvalidAuth),
+        (LoginError("Login failed with status 500"), config_flow.CannotConnect),
+    ],
+)
+async def test_validate_input_login_error(hass, login_error, expected):
+    """Test a wrapped credential error is InvalidAuth and other login errors CannotConnect."""
+    config_flow._VALIDATION_CACHE.clear()
+    data = {CONF_USERNAME: "test@example.com", CONF_PASSWORD: "test_password"}
+
+    with patch(
+        "custom_components.sensorlinx.config_flow.Sensorlinx"
+    ) as mock_sensorlinx:
+        client = mock_sensorlinx.return_value
+        client.login = AsyncMock(side_effect=login_error)
+        client.close = AsyncMock()
+
+        with pytest.raises(expected):
+            await config_flow.validate_input(hass, data)
+
+    client.close.assert_awaited_once()
+    assert not config_flow._VALIDATION_CACHE
+
+
+async def test_options_flow(hass):
+    """Test the scan interval can be changed through the options flow."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_USERNAME: "test@example.com", CONF_PASSWORD: "test_password"},
+    )
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    assert result["type"] == "form"
+    assert result["step_id"] == "init"
+
+    result2 = await hass.config_entries.options.async_configure(
+        result["flow_id"], {CONF_SCAN_INTERVAL: 600}
+    )
+
+    assert result2["type"] == "create_entry"
+    assert entry.options == {CONF_SCAN_INTERVAL: 600}
@@ -0,0 +1,252 @@
+"""Test the SensorLinx data update coordinator."""
+import asyncio
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from homeassistant.const import CONF_PASSWORD, CONF_SCAN_INTERVAL, CONF_USERNAME
+from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.sensorlinx.const import (
+    DATA_BUILDINGS,
+    DATA_DEVICES,
+    DATA_PROFILE,
+    DOMAIN,
+    EMPTY_ACCOUNT_SCAN_INTERVAL,
+)
+from custom_components.sensorlinx.coordinator import SensorLinxDataUpdateCoordinator
+
+PROFILE = {"email": "test@example.com"}
+
+
+def _coordinator(hass, set_device_parameter=None, options=None):
+    """Return a coordinator with a stubbed SensorLinx client."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_USERNAME: "test@example.com", CONF_PASSWORD: "test_password"},
+        options=options or {},
+    )
+    entry.add_to_hass(hass)
+    coordinator = SensorLinxDataUpdateCoordinator(hass, entry)
+    client = coordinator.sensorlinx = MagicMock()
+    client.login = AsyncMock()
+    client.close = AsyncMock()
+    client.get_profile = AsyncMock(return_value=PROFILE)
+    client.get_buildings = AsyncMock(return_value=[])
+    client.get_devices = AsyncMock(return_value=[])
+    client.set_device_parameter = set_device_parameter
+    return coordinator
+
+
+async def test_session_kept_between_polls(hass):
+    """Test a second poll reuses the session instead of logging in again."""
+    coordinator = _coordinator(hass)
+
+    await coordinator._async_update_data()
+    await coordinator._async_update_data()
+
+    assert coordinator.sensorlinx.login.await_count == 1
+    assert coordinator.sensorlinx.get_profile.await_count == 2
+
+
+async def test_empty_profile_logs_in_again_once(hass):
+    """Test an expired session is replaced by exactly one new login."""
+    coordinator = _coordinator(hass)
+    await coordinator._async_update_data()
+
+    coordinator.sensorlinx.get_profile.side_effect = [None, PROFILE]
+    data = await coordinator._async_update_data()
+
+    assert data[DATA_PROFILE] == PROFILE
+    assert coordinator.sensorlinx.login.await_count == 2
+
+
+async def test_rejected_session_logs_in_on_next_poll(hass):
+    """Test a profile still empty after logging in again fails auth and resets the session."""
+    coordinator = _coordinator(hass)
+    coordinator.sensorlinx.get_profile.return_value = None
+
+    with pytest.raises(ConfigEntryAuthFailed):
+        await coordinator._async_update_data()
+    assert coordinator.sensorlinx.login.await_count == 2
+
+    coordinator.sensorlinx.get_profile.return_value = PROFILE
+    await coordinator._async_update_data()
+    assert coordinator.sensorlinx.login.await_count == 3
+
+
+async def test_empty_account_backs_off(hass):
+    """Test an account without buildings is polled hourly with empty data."""
+    coordinator = _coordinator(hass)
+
+    data = await coordinator._async_update_data()
+
+    assert data == {DATA_PROFILE: PROFILE, DATA_BUILDINGS: [], DATA_DEVICES: {}}
+    assert coordinator.update_interval == timedelta(seconds=EMPTY_ACCOUNT_SCAN_INTERVAL)
+
+
+@pytest.mark.parametrize("buildings", [None, [{"id": "building1"}]])
+async def test_back_off_ends_with_configured_interval(hass, buildings):
+    """Test a failed building fetch or returning buildings restore the configured interval."""
+    coordinator = _coordinator(hass, options={CONF_SCAN_INTERVAL: 120})
+    await coordinator._async_update_data()
+
+    coordinator.sensorlinx.get_buildings.return_value = buildings
+    await coordinator._async_update_data()
+
+    assert coordinator.update_interval == timedelta(seconds=120)
+
+
+async def test_apply_options_keeps_empty_account_back_off(hass):
+    """Test new options wait until the empty account has buildings again."""
+    coordinator = _coordinator(hass)
+    await coordinator._async_update_data()
+
+    hass.config_entries.async_update_entry(
+        coordinator.entry, options={CONF_SCAN_INTERVAL: 120}
+    )
+    coordinator.async_apply_options()
+    assert coordinator.update_interval == timedelta(seconds=EMPTY_ACCOUNT_SCAN_INTERVAL)
+
+    coordinator.sensorlinx.get_buildings.return_value = [{"id": "building1"}]
+    await coordinator._async_update_data()
+    assert coordinator.update_interval == timedelta(seconds=120)
+
+
+@pytest.mark.parametrize("newer_error", [None, RuntimeError("write failed")])
+@pytest.mark.parametrize("chain_length", [2, 3])
+async def test_superseded_write_takes_newer_result(hass, chain_length, newer_error):
+    """Test superseded writes are cancelled and every caller gets the newest result."""
+    targets = [100 + step for step in range(chain_length)]
+    started = {target: asyncio.Event() for target in targets}
+    calls = []
+
+    async def set_device_parameter(building_id, device_id, **parameters):
+        target = parameters["hot_tank_min_temp"]
+        calls.append(target)
+        started[target].set()
+        if target != targets[-1]:
+            await asyncio.Event().wait()  # only ends by being cancelled
+        elif newer_error:
+            raise newer_error
+
+    coordinator = _coordinator(hass, set_device_parameter)
+    callers = []
+    for target in targets:
+        callers.append(
+            hass.async_create_task(
+                coordinator.async_set_device_parameters(
+                    "building1", "device1", hot_tank_min_temp=target
+                )
+            )
+        )
+        await started[target].wait()
+
+    results = await asyncio.gather(*callers, return_exceptions=True)
+
+    if newer_error:
+        assert all(isinstance(result, RuntimeError) for result in results)
+    else:
+        assert results == [None] * chain_length
+    assert calls == targets
+    assert not coordinator._inflight_writes
+    assert not coordinator._write_successors
+
+
+async def test_cancelled_caller_following_successor(hass):
+    """Test a caller cancelled while following a newer write raises and cleans up."""
+    started = {100: asyncio.Event(), 110: asyncio.Event()}
+    release = asyncio.Event()
+
+    async def set_device_parameter(building_id, device_id, **parameters):
+        started[parameters["hot_tank_min_temp"]].set()
+        if parameters["hot_tank_min_temp"] == 100:
+            await asyncio.Event().wait()  # only ends by being cancelled
+        await release.wait()
+
+    coordinator = _coordinator(hass, set_device_parameter)
+    first = hass.async_create_task(
+        coordinator.async_set_device_parameters("building1", "device1", hot_tank_min_temp=100)
+    )
+    await started[100].wait()
+    second = hass.async_create_task(
+        coordinator.async_set_device_parameters("building1", "device1", hot_tank_min_temp=110)
+    )
+    await started[110].wait()
+    for _ in range(3):
+        await asyncio.sleep(0)
+    # Both callers are now waiting on the newer write
+    assert list(coordinator._write_waiters.values()) == [2]
+
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    assert not coordinator._write_successors
+
+    release.set()
+    await second
+    assert not coordinator._inflight_writes
+    assert not coordinator._write_successors
+
+
+async def test_partly_overlapping_write_is_not_cancelled(hass):
+    """Test an in-flight write keeps going when a newer one doesn't cover it."""
+    started = asyncio.Event()
+    release = asyncio.Event()
+    completed = []
+
+    async def set_device_parameter(building_id, device_id, **parameters):
+        if "hvac_mode_priority" in parameters:
+            started.set()
+            await release.wait()
+        completed.append(parameters)
+
+    coordinator = _coordinator(hass, set_device_parameter)
+    first = hass.async_create_task(
+        coordinator.async_set_device_parameters(
+            "building1", "device1", hvac_mode_priority="cool", hot_tank_min_temp=100
+        )
+    )
+    await started.wait()
+    await coordinator.async_set_device_parameters(
+        "building1", "device1", hot_tank_min_temp=110
+    )
+    release.set()
+    await first
+
+    assert completed == [
+        {"hot_tank_min_temp": 110},
+        {"hvac_mode_priority": "cool", "hot_tank_min_temp": 100},
+    ]
+
+
+async def test_shutdown_cancels_refresh_and_writes(hass):
+    """Test shutdown stops the debounced refresh and in-flight writes, then closes."""
+    started = asyncio.Event()
+
+    async def set_device_parameter(building_id, device_id, **parameters):
+        started.set()
+        await asyncio.Event().wait()  # only ends by being cancelled
+
+    coordinator = _coordinator(hass, set_device_parameter)
+    write = hass.async_create_task(
+        coordinator.async_set_device_parameters("building1", "device1", hot_tank_min_temp=100)
+    )
+    await started.wait()
+    await coordinator.async_request_refresh()
+
+    await coordinator.async_shutdown()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=5))
+    await hass.async_block_till_done()
+
+    with pytest.raises(asyncio.CancelledError):
+        await write
+    coordinator.sensorlinx.login.assert_not_awaited()
+    coordinator.sensorlinx.get_profile.assert_not_awaited()
+    coordinator.sensorlinx.close.assert_awaited_once()